@@ -1,14 +1,43 @@
 import asyncio
+from typing import Optional
+
 from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+
+async def main(target_name: Optional[str] = None, timeout: float = 5.0) -> None:
+    """Scan for BLE devices and print them as they are discovered.
 
+    Devices are streamed via a detection callback instead of collected
+    after a fixed scan window. If target_name is given, the scan stops as
+    soon as a device whose name contains that substring is seen.
 
-async def main():
-    """Scan for BLE devices and print them."""
+    Args:
+        target_name: Optional substring to match against device names
+        timeout: Maximum scan duration in seconds
+    """
     print("Scanning for BLE devices...")
-    devices = await BleakScanner.discover()
-    print(f"\nFound {len(devices)} device(s):\n")
-    for d in devices:
-        print(d)
+    stop = asyncio.Event()
+    found: dict[str, BLEDevice] = {}
+
+    def cb(device: BLEDevice, adv: AdvertisementData) -> None:
+        if device.address not in found:
+            found[device.address] = device
+            print(device)
+            if target_name and device.name and target_name in device.name:
+                stop.set()
+
+    scanner = BleakScanner(detection_callback=cb)
+    await scanner.start()
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await scanner.stop()
+
+    print(f"\nFound {len(found)} device(s)")
 
 
 if __name__ == "__main__":
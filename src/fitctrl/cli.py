@@ -3,20 +3,23 @@ Main REPL application for FTMS fitness equipment control.
 
 Interactive command loop with async support, auto-completion,
 and live sensor display.
+
+prompt_toolkit and pyftms are imported lazily so one-shot invocations
+(fitctrl --help, argparse errors) do not pay their import cost.
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
 import logging
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from prompt_toolkit import PromptSession
-from prompt_toolkit.formatted_text import FormattedText
-from prompt_toolkit.history import InMemoryHistory
-from pyftms import ResultCode
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.formatted_text import FormattedText
 
-from .commands import COMMANDS, CommandCompleter, get_command
 from .controller import TreadmillController
 from .display import DisplayManager
 
@@ -27,12 +30,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maps argparse flag attributes to CLI command names (--resume is an
+# alias for start); adding a new flag is a one-line change here.
+_FLAG_TO_CMD = (
+    ("start", "start"),
+    ("resume", "start"),
+    ("pause", "pause"),
+    ("stop", "stop"),
+    ("status", "status"),
+    ("clear_cache", "clear-cache"),
+)
+
 
 class FitCtrlREPL:
     """Interactive REPL for FTMS fitness equipment control."""
 
     def __init__(self) -> None:
         """Initialize REPL with controller and display manager."""
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import InMemoryHistory
+
+        from .commands import CommandCompleter
+
         self.controller = TreadmillController()
         self.display = DisplayManager()
         self.running = False
@@ -52,6 +71,10 @@ class FitCtrlREPL:
         # Background update task
         self._update_task: Optional[asyncio.Task] = None
 
+        # Prompt cache - rebuilt only on connect/disconnect transitions
+        self._cached_prompt: Optional[FormattedText] = None
+        self._cached_prompt_name: Optional[str] = None
+
     async def run(self) -> None:
         """Run the main REPL loop."""
         self.running = True
@@ -103,16 +126,27 @@ class FitCtrlREPL:
     def _get_prompt(self) -> FormattedText:
         """Get dynamic prompt based on connection state.
 
+        The FormattedText is cached and only rebuilt when the connection
+        state (or device name) changes, since this runs per prompt render.
+
         Returns:
             FormattedText for prompt_toolkit
         """
+        from prompt_toolkit.formatted_text import FormattedText
+
         if self.controller.is_connected:
             device_name = (
                 self.controller._client.name if self.controller._client else "Device"
             )
-            return FormattedText([("class:prompt", f"[{device_name}] > ")])
         else:
-            return FormattedText([("class:prompt", "[disconnected] > ")])
+            device_name = "disconnected"
+
+        if self._cached_prompt is None or self._cached_prompt_name != device_name:
+            self._cached_prompt = FormattedText(
+                [("class:prompt", f"[{device_name}] > ")]
+            )
+            self._cached_prompt_name = device_name
+        return self._cached_prompt
 
     async def _handle_input(self, text: str) -> None:
         """Parse and dispatch command.
@@ -120,6 +154,8 @@ class FitCtrlREPL:
         Args:
             text: Raw user input text
         """
+        from .commands import get_command
+
         parts = text.split(maxsplit=1)
         if not parts:
             return
@@ -151,7 +187,11 @@ class FitCtrlREPL:
             logger.exception("Command exception")
 
     async def _update_loop(self) -> None:
-        """Background task to process sensor updates."""
+        """Background task to process sensor updates.
+
+        The controller coalesces bursts into a single latest reading, so
+        each iteration here corresponds to at most one display update.
+        """
         try:
             async for update_data in self.controller.get_updates():
                 if self.display.live_enabled:
@@ -223,6 +263,8 @@ class FitCtrlREPL:
 
     async def cmd_start(self, args: list) -> None:
         """Start or resume treadmill."""
+        from pyftms import ResultCode
+
         if not self.controller.is_connected:
             self.display.print_error("Not connected. Use 'connect' first.")
             return
@@ -239,6 +281,8 @@ class FitCtrlREPL:
 
     async def cmd_stop(self, args: list) -> None:
         """Stop treadmill."""
+        from pyftms import ResultCode
+
         if not self.controller.is_connected:
             self.display.print_error("Not connected. Use 'connect' first.")
             return
@@ -263,6 +307,8 @@ class FitCtrlREPL:
 
     async def cmd_pause(self, args: list) -> None:
         """Pause treadmill."""
+        from pyftms import ResultCode
+
         if not self.controller.is_connected:
             self.display.print_error("Not connected. Use 'connect' first.")
             return
@@ -278,6 +324,8 @@ class FitCtrlREPL:
 
     async def cmd_speed(self, args: list) -> None:
         """Set target speed in km/h."""
+        from pyftms import ResultCode
+
         if not self.controller.is_connected:
             self.display.print_error("Not connected. Use 'connect' first.")
             return
@@ -349,7 +397,7 @@ class FitCtrlREPL:
         self.display.console.print(f"  Running: {self.controller._is_running}")
         self.display.console.print(f"  Live enabled: {self.display.live_enabled}")
         self.display.console.print(
-            f"  Update queue size: {self.controller._update_queue.qsize()}"
+            f"  Update pending: {self.controller._latest_event.is_set()}"
         )
         self.display.console.print(f"  Live data: {self.display._live_data}")
 
@@ -362,6 +410,8 @@ class FitCtrlREPL:
 
     async def cmd_help(self, args: list) -> None:
         """Show all available commands."""
+        from .commands import COMMANDS
+
         self.display.print_help(COMMANDS)
 
     async def cmd_quit(self, args: list) -> None:
@@ -379,6 +429,8 @@ class FitCtrlREPL:
 
 async def run_cli_command(command: str) -> None:
     """Run a single CLI command and exit."""
+    from pyftms import ResultCode
+
     controller = TreadmillController()
     display = DisplayManager()
 
@@ -481,18 +533,11 @@ Examples:
 
     args = parser.parse_args()
 
-    # Check which command was requested
-    commands = []
-    if args.start or args.resume:
-        commands.append("start")
-    if args.pause:
-        commands.append("pause")
-    if args.stop:
-        commands.append("stop")
-    if args.status:
-        commands.append("status")
-    if args.clear_cache:
-        commands.append("clear-cache")
+    # Check which command was requested (dedupe so --start --resume
+    # still counts as a single command)
+    commands = list(
+        dict.fromkeys(cmd for attr, cmd in _FLAG_TO_CMD if getattr(args, attr))
+    )
 
     # If no CLI commands, start REPL
     if not commands:
@@ -5,8 +5,10 @@ Defines all available commands with metadata and provides a completer
 for prompt_toolkit auto-completion.
 """
 
+import bisect
+import functools
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, Final, List
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
@@ -23,8 +25,9 @@ class Command:
     handler: str
 
 
-# Define all available commands
-COMMANDS = [
+# Define all available commands (frozen: the index below and the
+# get_command cache both rely on this never changing after import)
+COMMANDS: Final[tuple[Command, ...]] = (
     Command(
         name="connect",
         aliases=["c"],
@@ -109,35 +112,66 @@ COMMANDS = [
         usage="quit",
         handler="cmd_quit",
     ),
-]
-
-
+)
+
+
+# Index commands by name and alias once at import time so lookups are a
+# single hash probe instead of a scan over COMMANDS per dispatch.
+_COMMAND_INDEX: dict[str, Command] = {}
+for _cmd in COMMANDS:
+    _COMMAND_INDEX[_cmd.name] = _cmd
+    for _alias in _cmd.aliases:
+        _COMMAND_INDEX[_alias] = _cmd
+del _cmd, _alias
+
+# Sorted names and aliases for the completer to reuse
+_COMMAND_NAMES_SORTED: tuple[str, ...] = tuple(sorted(_COMMAND_INDEX))
+
+# Completer candidate sets, derived once at import: COMMANDS is frozen,
+# so every CommandCompleter instance can share these.
+_COMMAND_NAMES: Final[frozenset[str]] = frozenset(cmd.name for cmd in COMMANDS)
+_COMMAND_ALIASES: Final[frozenset[str]] = frozenset(
+    alias for cmd in COMMANDS for alias in cmd.aliases
+)
+_ALL_COMPLETIONS: Final[frozenset[str]] = _COMMAND_NAMES | _COMMAND_ALIASES
+# Common speeds: 1.0, 1.5, 2.0, ..., 12.0 (sorted lexicographically so
+# prefix matches form a contiguous bisect range)
+_SPEED_SUGGESTIONS: Final[tuple[str, ...]] = tuple(
+    sorted(f"{i / 2:.1f}" for i in range(2, 25))
+)
+
+
+@functools.lru_cache(maxsize=256)
 def get_command(name: str) -> Command | None:
     """Get command by name or alias.
 
+    Memoized: the same short tokens recur on every dispatch, so repeat
+    lookups resolve in the C-level cache. The command table is immutable
+    after import, so entries never go stale.
+
     Args:
         name: Command name or alias
 
     Returns:
         Command object if found, None otherwise
     """
-    for cmd in COMMANDS:
-        if cmd.name == name or name in cmd.aliases:
-            return cmd
-    return None
+    return _COMMAND_INDEX.get(name)
 
 
 class CommandCompleter(Completer):
     """Auto-completion for commands and arguments."""
 
     def __init__(self) -> None:
-        """Initialize completer."""
-        self._command_names = set()
-        self._command_aliases = set()
+        """Initialize completer.
 
-        for cmd in COMMANDS:
-            self._command_names.add(cmd.name)
-            self._command_aliases.update(cmd.aliases)
+        All candidate data is derived from the frozen COMMANDS table at
+        import time, so construction is just attribute binding.
+        """
+        self._command_names = _COMMAND_NAMES
+        self._command_aliases = _COMMAND_ALIASES
+        self._all_completions = _ALL_COMPLETIONS
+        self._all_names_sorted = _COMMAND_NAMES_SORTED
+        self._speed_suggestions = _SPEED_SUGGESTIONS
 
     def get_completions(self, document: Document, complete_event) -> Any:  # type: ignore[no-untyped-def]
         """Get completion suggestions for current input.
@@ -159,17 +193,21 @@ class CommandCompleter(Completer):
         # First part: complete command name
         if len(parts) <= 1:
             partial_cmd = parts[0].lower() if parts else ""
-            all_names = self._command_names | self._command_aliases
 
-            for name in sorted(all_names):
-                if name.startswith(partial_cmd):
-                    # Calculate completion (what needs to be added)
-                    completion = name[len(partial_cmd) :]
-                    yield Completion(
-                        completion,
-                        start_position=-len(partial_cmd),
-                        display=f"({name})",
-                    )
+            # Prefix matches form one contiguous range in the sorted tuple:
+            # bisect to the first candidate and stop at the first mismatch.
+            names = self._all_names_sorted
+            for i in range(bisect.bisect_left(names, partial_cmd), len(names)):
+                name = names[i]
+                if not name.startswith(partial_cmd):
+                    break
+                # Calculate completion (what needs to be added)
+                completion = name[len(partial_cmd) :]
+                yield Completion(
+                    completion,
+                    start_position=-len(partial_cmd),
+                    display=f"({name})",
+                )
 
         # Second part: suggest speed values if command is "speed"
         elif len(parts) >= 2:
@@ -178,18 +216,14 @@ class CommandCompleter(Completer):
                 # Suggest speed values
                 partial = parts[-1].lower() if parts[-1] else ""
 
-                # Suggest common speeds: 1.0, 1.5, 2.0, ..., 12.0
-                suggested_speeds = []
-                speed = 1.0
-                while speed <= 12.0:
-                    suggested_speeds.append(f"{speed:.1f}")
-                    speed += 0.5
-
-                for speed_str in suggested_speeds:
-                    if speed_str.startswith(partial):
-                        completion = speed_str[len(partial) :]
-                        yield Completion(
-                            completion,
-                            start_position=-len(partial),
-                            display=speed_str,
-                        )
+                speeds = self._speed_suggestions
+                for i in range(bisect.bisect_left(speeds, partial), len(speeds)):
+                    speed_str = speeds[i]
+                    if not speed_str.startswith(partial):
+                        break
+                    completion = speed_str[len(partial) :]
+                    yield Completion(
+                        completion,
+                        start_position=-len(partial),
+                        display=speed_str,
+                    )
@@ -3,32 +3,51 @@ Async wrapper around pyftms client for FTMS fitness equipment control.
 
 This module provides a clean interface to the FTMS protocol, handling
 connection management, command execution, and event callbacks.
+
+bleak and pyftms are imported lazily inside the methods that use them:
+they pull in heavy transitive imports (and DBus probing on Linux), which
+would otherwise be paid by every CLI invocation including --help.
 """
 
+from __future__ import annotations
+
+import array
 import asyncio
 import logging
-from typing import Any, AsyncGenerator, Callable, Optional
-
-import json
-import os
-import platform
+import random
 from pathlib import Path
-
-from bleak import BleakScanner
-from pyftms import (
-    FitnessMachine,
-    FtmsEvents,
-    MachineType,
-    ResultCode,
-    UpdateEvent,
-    get_client,
-    get_client_from_address,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    ClassVar,
+    Optional,
 )
 
-from .core import FTMS_SERVICE_UUID, SPEED_MIN, SPEED_MAX, SPEED_STEP
+if TYPE_CHECKING:
+    from pyftms import FitnessMachine, FtmsEvents, ResultCode
+
+from .core import (
+    FTMS_SERVICE_UUID,
+    SPEED_MAX,
+    SPEED_MIN,
+    SPEED_STEP,
+    normalize_update,
+)
 
 logger = logging.getLogger(__name__)
 
+# Status returned when no device is connected
+_DISCONNECTED_STATUS = {
+    "status": "DISCONNECTED",
+    "speed": 0.0,
+    "distance": 0,
+    "time": 0,
+    "steps": 0,
+    "calories": 0,
+}
+
 
 class TreadmillController:
     """Manages connection and control of FTMS-compatible treadmills."""
@@ -41,49 +60,90 @@ class TreadmillController:
     # FTMS service UUID for device discovery
     FTMS_SERVICE_UUID = FTMS_SERVICE_UUID
 
+    # Known FTMS device name fragments, casefolded for matching
+    _NAME_NEEDLES = ("ks-ap-rq3", "walkingpad", "treadmill")
+
+    # Memoized cache file path - resolving it hits os.environ and mkdir
+    _cache_file: ClassVar[Optional[Path]] = None
+
     @classmethod
     def _get_cache_file(cls) -> Path:
         """Get the standard cache file location for device address."""
-        # Check XDG_CACHE_HOME first (Linux/Unix standard)
-        cache_dir = os.environ.get("XDG_CACHE_HOME")
-        if cache_dir:
-            cache_path = Path(cache_dir) / "fitctrl"
-        else:
-            # Platform-specific fallbacks
-            system = platform.system()
-            if system == "Darwin":  # macOS
-                cache_path = Path.home() / "Library" / "Caches" / "fitctrl"
-            elif system == "Windows":
-                # Use LOCALAPPDATA if available, otherwise APPDATA
-                local_appdata = os.environ.get("LOCALAPPDATA")
-                if local_appdata:
-                    cache_path = Path(local_appdata) / "fitctrl"
-                else:
-                    appdata = os.environ.get(
-                        "APPDATA", str(Path.home() / "AppData" / "Roaming")
-                    )
-                    cache_path = Path(appdata) / "fitctrl"
-            else:  # Linux/Unix fallback
-                cache_path = Path.home() / ".cache" / "fitctrl"
+        if cls._cache_file is None:
+            from platformdirs import user_cache_dir
+
+            cache_path = Path(user_cache_dir("fitctrl"))
+            cache_path.mkdir(parents=True, exist_ok=True)
+            cls._cache_file = cache_path / "device_address.txt"
+        return cls._cache_file
 
-        # Ensure directory exists
-        cache_path.mkdir(parents=True, exist_ok=True)
-        return cache_path / "device_address.json"
+    # Connection retry policy for transient BLE errors
+    CONNECT_ATTEMPTS = 5
+
+    # Ring-buffer capacity for per-field reading history
+    HISTORY_SIZE = 4096
+
+    # Numeric fields recorded in the history ring buffers
+    _HISTORY_FIELDS = ("speed", "distance", "time", "steps", "calories")
 
     def __init__(self) -> None:
         """Initialize controller with no device connection."""
         self._client: Optional[FitnessMachine] = None
-        self._update_queue: asyncio.Queue = asyncio.Queue(maxsize=10)
         self._is_running = False
 
+        # Connection state flag - kept in sync by connect/disconnect paths
+        # so is_connected is a single attribute read on hot paths
+        self._connected = False
+
+        # Event loop the controller runs on; recorded at connect time so
+        # BLE-thread callbacks can post work onto it safely
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Latest-value slot: new readings overwrite the previous one so
+        # consumers always see the freshest sample and nothing queues up
+        self._latest: Optional[dict] = None
+        self._latest_event = asyncio.Event()
+
+        # Set on disconnect so update consumers wake up and exit
+        # immediately instead of polling _is_running
+        self._shutdown_event = asyncio.Event()
+
+        # Running snapshot of sensor values, maintained by the event
+        # callback so get_status never has to probe the client
+        self._last_status: dict = dict(_DISCONNECTED_STATUS)
+
+        # Reading history in structure-of-arrays layout: one flat numeric
+        # ring buffer per field instead of a dict per reading
+        self._history: dict[str, array.array] = {
+            field: array.array("d", [0.0] * self.HISTORY_SIZE)
+            for field in self._HISTORY_FIELDS
+        }
+        self._history_index = 0
+
+        # Serialize connection attempts - concurrent connects can wedge BlueZ
+        self._connect_lock = asyncio.Lock()
+
         # Callbacks
         self._on_update: Optional[Callable] = None
         self._on_disconnect: Optional[Callable] = None
 
     @property
     def is_connected(self) -> bool:
-        """Check if currently connected to device."""
-        return self._client is not None and self._client.is_connected
+        """Check if currently connected to device.
+
+        Returns the tracked connection flag; use verify_connected() to
+        reconfirm against the BLE adapter when that actually matters.
+        """
+        return self._connected
+
+    def verify_connected(self) -> bool:
+        """Re-check the connection state against the BLE client.
+
+        Returns:
+            True if the underlying client reports an active connection
+        """
+        self._connected = self._client is not None and self._client.is_connected
+        return self._connected
 
     @property
     def device_info(self) -> Any:
@@ -131,9 +191,7 @@ class TreadmillController:
         try:
             cache_file = self._get_cache_file()
             if cache_file.exists():
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    return data.get("address")
+                return cache_file.read_text().strip() or None
         except Exception as e:
             logger.warning(f"Failed to load cached address: {e}")
         return None
@@ -146,9 +204,7 @@ class TreadmillController:
         """
         try:
             cache_file = self._get_cache_file()
-            data = {"address": address}
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            cache_file.write_text(address)
             logger.info(f"Cached device address: {address}")
         except Exception as e:
             logger.warning(f"Failed to save cached address: {e}")
@@ -166,121 +222,173 @@ class TreadmillController:
         except Exception as e:
             logger.warning(f"Failed to clear cached address: {e}")
 
-    async def discover(self) -> bool:
+    async def discover(self, timeout: float = 10.0) -> bool:
         """Discover FTMS-compatible devices on BLE.
 
+        Scans with an advertisement callback filtered on the FTMS service
+        UUID so the backend discards unrelated traffic, and returns as
+        soon as the first matching device is seen instead of waiting out
+        the full scan window.
+
+        Args:
+            timeout: Maximum scan duration in seconds
+
         Returns:
             True if device found, False otherwise
         """
+        from bleak import BleakScanner
+
+        found = asyncio.Event()
+
+        def _on_detection(device: Any, adv: Any) -> None:
+            if found.is_set():
+                return
+            # Primary: known FTMS device names (casefold once per adv)
+            name = (device.name or "").casefold()
+            if name and any(needle in name for needle in self._NAME_NEEDLES):
+                logger.info(f"Found FTMS device: {device.name} ({device.address})")
+                self._device = device
+                found.set()
+                return
+
+            # Secondary: device advertises FTMS service (for future devices)
+            if self.FTMS_SERVICE_UUID in adv.service_uuids:
+                logger.info(
+                    f"Found FTMS device by service: {device.name or 'Unknown'} ({device.address})"
+                )
+                self._device = device
+                found.set()
+
         try:
             logger.info("Scanning for FTMS-compatible devices...")
-            scanner = BleakScanner()
-            devices = await scanner.discover(timeout=10.0)
-
-            for device in devices:
-                # Primary: check for known FTMS device names
-                if device.name and (
-                    "KS-AP-RQ3" in device.name
-                    or "WalkingPad" in device.name.upper()
-                    or "TREADMILL" in device.name.upper()
-                ):
-                    logger.info(f"Found FTMS device: {device.name} ({device.address})")
-                    self._device = device
-                    return True
-
-                # Secondary: check if device advertises FTMS service (for future devices)
-                service_uuids = (
-                    getattr(device, "service_uuids", None)
-                    or getattr(device, "advertisement", {}).get("service_uuids", [])
-                    or device.metadata.get("uuids", [])
-                    if hasattr(device, "metadata")
-                    else []
-                )
+            scanner = BleakScanner(
+                detection_callback=_on_detection,
+                service_uuids=[self.FTMS_SERVICE_UUID],
+            )
+            await scanner.start()
+            try:
+                await asyncio.wait_for(found.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                await scanner.stop()
 
-                if self.FTMS_SERVICE_UUID in service_uuids:
-                    logger.info(
-                        f"Found FTMS device by service: {device.name or 'Unknown'} ({device.address})"
-                    )
-                    self._device = device
-                    return True
+            if found.is_set():
+                return True
 
             logger.warning("No FTMS-compatible devices found")
             return False
         except Exception as e:
             logger.error(f"Discovery failed: {e}")
             return False
-        except Exception as e:
-            logger.error(f"Discovery failed: {e}")
-            return False
+
+    async def _connect_with_retry(self) -> None:
+        """Connect the current client, retrying transient BLE errors.
+
+        Retries with exponential backoff plus jitter (1s/2s/4s/8s) to ride
+        out transient BlueZ failures such as org.bluez.Error.InProgress or
+        "Software caused connection abort".
+
+        Raises:
+            BleakError: If all attempts fail
+        """
+        from bleak.exc import BleakError
+
+        assert self._client is not None
+        for attempt in range(self.CONNECT_ATTEMPTS):
+            try:
+                await self._client.connect()
+                return
+            except BleakError as e:
+                if attempt == self.CONNECT_ATTEMPTS - 1:
+                    raise
+                delay = (2**attempt) + random.random() * 0.25
+                logger.warning(
+                    f"Connect attempt {attempt + 1} failed ({e}); "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
     async def connect(self) -> bool:
         """Connect to FTMS-compatible device.
 
-        First tries to connect using cached address, then falls back to scanning.
+        First tries to connect using cached address, then falls back to
+        scanning. Attempts are serialized with a lock and retried with
+        exponential backoff on transient BLE errors.
 
         Returns:
             True if connected successfully, False otherwise
         """
-        if self._client is not None and self.is_connected:
-            logger.warning("Already connected")
-            return True
-
-        # First try cached address
-        cached_address = self._load_cached_address()
-        if cached_address:
-            logger.info(f"Trying cached address: {cached_address}")
+        from pyftms import MachineType, get_client, get_client_from_address
+
+        async with self._connect_lock:
+            if self._client is not None and self.is_connected:
+                logger.warning("Already connected")
+                return True
+
+            self._loop = asyncio.get_running_loop()
+            self._shutdown_event.clear()
+
+            # First try cached address
+            cached_address = self._load_cached_address()
+            if cached_address:
+                logger.info(f"Trying cached address: {cached_address}")
+                try:
+                    self._client = await get_client_from_address(
+                        cached_address,
+                        scan_timeout=5.0,  # Quick timeout for cached address
+                        timeout=5.0,
+                        on_ftms_event=self._on_ftms_event,
+                        on_disconnect=self._on_device_disconnect,
+                    )
+
+                    await self._connect_with_retry()
+                    self._is_running = True
+                    self._connected = True
+                    self._seed_status_from_client()
+                    logger.info(f"Connected to {self._client.name} (cached)")
+                    logger.info(f"Device info: {self._client.device_info}")
+
+                    # Cache the address for future use
+                    self._save_cached_address(cached_address)
+                    return True
+
+                except Exception as e:
+                    logger.warning(f"Cached address failed: {e}")
+                    self._client = None
+
+            # Fall back to scanning
+            logger.info("Scanning for device...")
+            if not await self.discover():
+                logger.error("Device discovery failed")
+                return False
+
             try:
-                self._client = await get_client_from_address(
-                    cached_address,
-                    scan_timeout=5.0,  # Quick timeout for cached address
+                logger.info("Connecting to discovered device...")
+                self._client = get_client(
+                    self._device,
+                    MachineType.TREADMILL,
                     timeout=5.0,
                     on_ftms_event=self._on_ftms_event,
                     on_disconnect=self._on_device_disconnect,
                 )
 
-                await self._client.connect()
+                await self._connect_with_retry()
                 self._is_running = True
-                logger.info(f"Connected to {self._client.name} (cached)")
+                self._connected = True
+                self._seed_status_from_client()
+                logger.info(f"Connected to {self._client.name}")
                 logger.info(f"Device info: {self._client.device_info}")
 
                 # Cache the address for future use
-                self._save_cached_address(cached_address)
+                if hasattr(self._device, "address"):
+                    self._save_cached_address(self._device.address)
                 return True
 
             except Exception as e:
-                logger.warning(f"Cached address failed: {e}")
+                logger.error(f"Connection failed: {e}")
                 self._client = None
-
-        # Fall back to scanning
-        logger.info("Scanning for device...")
-        if not await self.discover():
-            logger.error("Device discovery failed")
-            return False
-
-        try:
-            logger.info("Connecting to discovered device...")
-            self._client = get_client(
-                self._device,
-                MachineType.TREADMILL,
-                timeout=5.0,
-                on_ftms_event=self._on_ftms_event,
-                on_disconnect=self._on_device_disconnect,
-            )
-
-            await self._client.connect()
-            self._is_running = True
-            logger.info(f"Connected to {self._client.name}")
-            logger.info(f"Device info: {self._client.device_info}")
-
-            # Cache the address for future use
-            if hasattr(self._device, "address"):
-                self._save_cached_address(self._device.address)
-            return True
-
-        except Exception as e:
-            logger.error(f"Connection failed: {e}")
-            self._client = None
-            return False
+                return False
 
     async def disconnect(self) -> None:
         """Disconnect from device."""
@@ -290,6 +398,8 @@ class TreadmillController:
         try:
             logger.info("Disconnecting...")
             self._is_running = False
+            self._connected = False
+            self._shutdown_event.set()
             await self._client.disconnect()
             self._client = None
             logger.info("Disconnected")
@@ -302,6 +412,8 @@ class TreadmillController:
         Returns:
             ResultCode enum indicating success or failure
         """
+        from pyftms import ResultCode
+
         if not self.is_connected:
             logger.error("Not connected")
             return ResultCode.FAILED
@@ -320,6 +432,8 @@ class TreadmillController:
         Returns:
             ResultCode enum indicating success or failure
         """
+        from pyftms import ResultCode
+
         if not self.is_connected:
             logger.error("Not connected")
             return ResultCode.FAILED
@@ -338,6 +452,8 @@ class TreadmillController:
         Returns:
             ResultCode enum indicating success or failure
         """
+        from pyftms import ResultCode
+
         if not self.is_connected:
             logger.error("Not connected")
             return ResultCode.FAILED
@@ -359,15 +475,16 @@ class TreadmillController:
         Returns:
             ResultCode enum indicating success or failure
         """
+        from pyftms import ResultCode
+
         if not self.is_connected:
             logger.error("Not connected")
             return ResultCode.FAILED
 
-        # Validate range
-        if km_h < self.SPEED_MIN or km_h > self.SPEED_MAX:
-            logger.error(
-                f"Speed {km_h} out of range [{self.SPEED_MIN}, {self.SPEED_MAX}]"
-            )
+        # Validate range (module constants: one chained comparison, no
+        # per-call attribute traversal)
+        if not SPEED_MIN <= km_h <= SPEED_MAX:
+            logger.error(f"Speed {km_h} out of range [{SPEED_MIN}, {SPEED_MAX}]")
             return ResultCode.INVALID_PARAMETER
 
         try:
@@ -378,6 +495,26 @@ class TreadmillController:
             logger.error(f"Set speed failed: {e}")
             return ResultCode.FAILED
 
+    def _seed_status_from_client(self) -> None:
+        """Seed the status snapshot from client properties after connect.
+
+        Subsequent values come from update events, so this is the only
+        place the client properties are read for status purposes.
+        """
+        if self._client is None:
+            return
+        training_status = self._client.training_status
+        self._last_status.update(
+            {
+                "status": training_status.name if training_status else "UNKNOWN",
+                "speed": self._client.speed_instant or 0.0,
+                "distance": self._client.distance_total or 0,
+                "time": self._client.time_elapsed or 0,
+                "steps": self._client.step_count or 0,
+                "calories": self._client.energy_total or 0,
+            }
+        )
+
     def get_status(self) -> dict:
         """Get current sensor values without waiting for update.
 
@@ -385,58 +522,92 @@ class TreadmillController:
             Dictionary with current sensor values
         """
         if not self.is_connected:
-            return {
-                "status": "DISCONNECTED",
-                "speed": 0.0,
-                "distance": 0,
-                "time": 0,
-                "steps": 0,
-                "calories": 0,
-            }
-
-        status_str = (
-            self._client.training_status.name  # type: ignore  # type: ignore
-            if self._client.training_status  # type: ignore  # type: ignore
-            else "UNKNOWN"
-        )
-
-        return {
-            "status": status_str,
-            "speed": self._client.speed_instant or 0.0,  # type: ignore[union-attr]
-            "distance": self._client.distance_total or 0,  # type: ignore[union-attr]
-            "time": self._client.time_elapsed or 0,  # type: ignore[union-attr]
-            "steps": self._client.step_count or 0,  # type: ignore[union-attr]
-            "calories": self._client.energy_total or 0,  # type: ignore[union-attr]
-        }
+            return dict(_DISCONNECTED_STATUS)
+        return dict(self._last_status)
 
     def _on_ftms_event(self, event: FtmsEvents) -> None:
         """Handle FTMS events from device.
 
-        Called synchronously from BLE thread - must not block.
+        Called synchronously from BLE thread - must not block. Delivery
+        is posted onto the controller's event loop so asyncio primitives
+        are only touched from their own thread.
 
         Args:
             event: FtmsEvents union (UpdateEvent, SetupEvent, ControlEvent, etc.)
         """
+        from pyftms import UpdateEvent
+
         try:
             if isinstance(event, UpdateEvent):
-                # Queue update for async processing
-                if self._is_running:
-                    self._update_queue.put_nowait(event.event_data)
-        except asyncio.QueueFull:
-            # Drop if backed up - live display can skip a frame
-            pass
+                if self._is_running and self._loop is not None:
+                    self._loop.call_soon_threadsafe(self._deliver, event.event_data)
         except Exception as e:
             logger.error(f"Event handler error: {e}")
 
+    def _deliver(self, data: dict) -> None:
+        """Record a sensor reading; runs on the controller's event loop.
+
+        Overwrites the latest reading - consumers only ever need the
+        freshest sample - and keeps the status snapshot current.
+
+        Args:
+            data: UpdateEventData dict from the device
+        """
+        self._latest = data
+        self._last_status.update(normalize_update(data))
+
+        # Record the merged snapshot in the history ring buffers
+        slot = self._history_index % self.HISTORY_SIZE
+        status = self._last_status
+        for field in self._HISTORY_FIELDS:
+            self._history[field][slot] = float(status[field])
+        self._history_index += 1
+
+        self._latest_event.set()
+
+    def history(self, field: str) -> list[float]:
+        """Get recorded readings for a sensor field, oldest first.
+
+        At most HISTORY_SIZE readings are retained; older ones are
+        overwritten in place.
+
+        Args:
+            field: One of speed, distance, time, steps, calories
+
+        Returns:
+            Chronological list of recorded values
+
+        Raises:
+            KeyError: If field is not a recorded sensor field
+        """
+        buf = self._history[field]
+        if self._history_index < self.HISTORY_SIZE:
+            return buf[: self._history_index].tolist()
+        slot = self._history_index % self.HISTORY_SIZE
+        return (buf[slot:] + buf[:slot]).tolist()
+
     def _on_device_disconnect(self, client: FitnessMachine) -> None:
         """Handle device disconnect.
 
+        Called from the BLE thread; state changes and the user callback
+        are posted onto the controller's event loop so the BLE thread
+        never runs user code or touches asyncio primitives.
+
         Args:
             client: The FitnessMachine client that disconnected
         """
         logger.warning("Device disconnected")
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._handle_disconnect)
+        else:
+            self._handle_disconnect()
+
+    def _handle_disconnect(self) -> None:
+        """Finalize a device-initiated disconnect on the event loop."""
         self._client = None
         self._is_running = False
+        self._connected = False
+        self._shutdown_event.set()
         if self._on_disconnect:
             try:
                 self._on_disconnect()
@@ -444,21 +615,34 @@ class TreadmillController:
                 logger.error(f"Disconnect callback error: {e}")
 
     async def get_updates(self) -> AsyncGenerator[Any, None]:
-        """Async generator that yields sensor updates.
+        """Async generator that yields the latest sensor reading.
+
+        Readings arriving faster than the consumer are coalesced: only the
+        most recent sample is retained, so yields always reflect the
+        device's current state.
 
         Yields:
             UpdateEventData dicts as they arrive from the device
         """
         while self._is_running:
+            # Sleep until either new data or shutdown - no periodic timer
+            latest_wait = asyncio.ensure_future(self._latest_event.wait())
+            shutdown_wait = asyncio.ensure_future(self._shutdown_event.wait())
             try:
-                data = await asyncio.wait_for(
-                    self._update_queue.get(),
-                    timeout=0.5,
+                _, pending = await asyncio.wait(
+                    (latest_wait, shutdown_wait),
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                yield data
-            except asyncio.TimeoutError:
-                # Continue - device may be idle
-                continue
+                for task in pending:
+                    task.cancel()
             except Exception as e:
-                logger.error(f"Update queue error: {e}")
+                logger.error(f"Update wait error: {e}")
                 break
+
+            if self._shutdown_event.is_set():
+                break
+
+            self._latest_event.clear()
+            data = self._latest
+            if data is not None:
+                yield data
@@ -2,9 +2,39 @@
 Core constants and utilities for FTMS fitness equipment control.
 """
 
+from typing import Any
+
 # FTMS (Fitness Machine Service) UUID for device discovery
 FTMS_SERVICE_UUID = "00001826-0000-1000-8000-00805f9b34fb"
 
+# Maps FTMS update keys to the status-display key names
+FTMS_KEY_MAP = {
+    "speed_instant": "speed",
+    "distance_total": "distance",
+    "time_elapsed": "time",
+    "step_count": "steps",
+    "energy_total": "calories",
+    "training_status": "status",
+}
+
+
+def normalize_update(data: dict) -> dict[str, Any]:
+    """Map FTMS update keys to status keys, rendering enums by name.
+
+    Args:
+        data: UpdateEventData dict from pyftms
+
+    Returns:
+        Dict keyed like get_status output (speed, distance, time, ...)
+    """
+    return {
+        FTMS_KEY_MAP.get(key, key): (
+            value.name if key == "training_status" and hasattr(value, "name") else value
+        )
+        for key, value in data.items()
+    }
+
+
 # Speed constraints (device-dependent, WalkingPad R3 as reference)
 SPEED_MIN = 1.0
 SPEED_MAX = 12.0
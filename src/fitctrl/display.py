@@ -3,19 +3,71 @@ Display manager for Rich-based REPL output and live updates.
 
 Handles all console output including formatted tables, status display,
 and toggle-able live display updates.
+
+rich is imported lazily inside the methods that use it so CLI startup
+(e.g. fitctrl --help) does not pay for the full rich import tree.
 """
 
+from __future__ import annotations
+
+import functools
 import logging
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from rich.console import Console
+    from rich.live import Live
+    from rich.table import Table
 
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
+    from .commands import Command
+
+from .core import normalize_update
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _banner_panel() -> Any:
+    """Build the startup banner panel (once per process)."""
+    from rich.panel import Panel
+
+    return Panel(
+        "[bold cyan]FitCtrl - FTMS Equipment Control[/bold cyan]\n"
+        "[dim]Type 'help' for commands, 'quit' to exit[/dim]",
+        expand=False,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _help_table(key: tuple) -> Table:
+    """Build the command reference table.
+
+    Keyed on the (name, aliases, description, usage) rows so the table
+    is constructed once per command set; the set is static per process,
+    so repeat 'help' invocations are pure cache hits.
+
+    Args:
+        key: Tuple of (name, aliases, description, usage) row tuples
+
+    Returns:
+        Rich Table object
+    """
+    from rich.table import Table
+
+    table = Table(title="Available Commands", show_header=True)
+    table.add_column("Command", style="cyan")
+    table.add_column("Aliases", style="magenta")
+    table.add_column("Description", style="white")
+    table.add_column("Usage", style="yellow")
+
+    for name, aliases, description, usage in key:
+        table.add_row(name, ", ".join(aliases) if aliases else "-", description, usage)
+
+    return table
+
+
 class DisplayManager:
     """Manages console output with Rich library."""
 
@@ -25,6 +77,8 @@ class DisplayManager:
         Args:
             console: Rich Console instance (creates one if None)
         """
+        from rich.console import Console
+
         self.console = console or Console()
         self.live_enabled = False
         self._live: Optional[Live] = None
@@ -32,12 +86,7 @@ class DisplayManager:
 
     def print_banner(self) -> None:
         """Print startup banner."""
-        panel = Panel(
-            "[bold cyan]FitCtrl - FTMS Equipment Control[/bold cyan]\n"
-            "[dim]Type 'help' for commands, 'quit' to exit[/dim]",
-            expand=False,
-        )
-        self.console.print(panel)
+        self.console.print(_banner_panel())
 
     def print_status(self, data: dict) -> None:
         """Display one-time sensor status table.
@@ -97,23 +146,17 @@ class DisplayManager:
         """
         self.console.print(f"[cyan]Info:[/cyan] {message}", highlight=False)
 
-    def print_help(self, commands: list) -> None:
+    def print_help(self, commands: Sequence[Command]) -> None:
         """Display command reference.
 
         Args:
-            commands: List of Command objects
+            commands: Command objects to document
         """
-        table = Table(title="Available Commands", show_header=True)
-        table.add_column("Command", style="cyan")
-        table.add_column("Aliases", style="magenta")
-        table.add_column("Description", style="white")
-        table.add_column("Usage", style="yellow")
-
-        for cmd in commands:
-            aliases = ", ".join(cmd.aliases) if cmd.aliases else "-"
-            table.add_row(cmd.name, aliases, cmd.description, cmd.usage)
-
-        self.console.print(table)
+        key = tuple(
+            (cmd.name, tuple(cmd.aliases), cmd.description, cmd.usage)
+            for cmd in commands
+        )
+        self.console.print(_help_table(key))
         self.console.print(
             "[dim]Keyboard shortcuts: Ctrl+C to interrupt, Ctrl+D to exit[/dim]"
         )
@@ -133,8 +176,15 @@ class DisplayManager:
             "steps": 0,
             "calories": 0,
         }
-        renderable = self._create_live_table()
-        self._live = Live(renderable, console=self.console, refresh_per_second=2)
+        from rich.live import Live
+
+        # Pull model: Live calls _create_live_table on its own refresh
+        # tick, decoupling the render rate from the notification rate
+        self._live = Live(
+            get_renderable=self._create_live_table,
+            console=self.console,
+            refresh_per_second=2,
+        )
         self._live.start()
         self.console.print(
             "[dim]Live display enabled [Ctrl+L or 'live' to disable][/dim]"
@@ -159,36 +209,9 @@ class DisplayManager:
         if not self.live_enabled or self._live is None:
             return
 
-        # Normalize FTMS keys to match status command format
-        normalized_data = {}
-        for key, value in data.items():
-            if key == "speed_instant":
-                normalized_data["speed"] = value
-            elif key == "distance_total":
-                normalized_data["distance"] = value
-            elif key == "time_elapsed":
-                normalized_data["time"] = value
-            elif key == "step_count":
-                normalized_data["steps"] = value
-            elif key == "energy_total":
-                normalized_data["calories"] = value
-            elif key == "training_status":
-                # Convert training status enum to name
-                normalized_data["status"] = (
-                    value.name if hasattr(value, "name") else str(value)
-                )
-            else:
-                normalized_data[key] = value
-
-        # Update local cache with normalized values
-        self._live_data.update(normalized_data)
-
-        # Update the live display
-        try:
-            renderable = self._create_live_table()
-            self._live.update(renderable)
-        except Exception as e:
-            logger.error(f"Live update error: {e}")
+        # Update local cache with normalized values; Live pulls the
+        # rebuilt table itself on its next refresh tick
+        self._live_data.update(normalize_update(data))
 
     def toggle_live(self) -> bool:
         """Toggle live display on/off.
@@ -202,31 +225,12 @@ class DisplayManager:
             self.start_live()
         return self.live_enabled
 
-    def _create_live_table(self) -> Table:
-        """Create the live display table.
+    def _build_table(self, data: dict) -> Table:
+        """Build the sensor table for both status and live display.
 
-        Returns:
-            Rich Table with current sensor data
-        """
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="yellow")
-
-        table.add_row("Status", self._live_data.get("status", "UNKNOWN"))
-        table.add_row("Speed", self.format_speed(self._live_data.get("speed", 0.0)))
-        table.add_row(
-            "Distance", self.format_distance(self._live_data.get("distance", 0))
-        )
-        table.add_row("Time", self.format_time(self._live_data.get("time", 0)))
-        table.add_row("Steps", f"{self._live_data.get('steps', 0):,}")
-        table.add_row(
-            "Calories", self.format_energy(self._live_data.get("calories", 0))
-        )
-
-        return table
-
-    def format_status_table(self, data: dict) -> Table:
-        """Create Rich Table for sensor display.
+        Values are rendered through the memoized format_* helpers:
+        sensor values repeat heavily between render ticks (speed and
+        status especially), so most rows are cache hits.
 
         Args:
             data: Dictionary with status, speed, distance, time, steps, calories
@@ -234,12 +238,15 @@ class DisplayManager:
         Returns:
             Rich Table object
         """
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="yellow")
 
         table.add_row("Status", data.get("status", "UNKNOWN"))
-        table.add_row("Speed", self.format_speed(data.get("speed", 0.0)))
+        # Quantize the speed so the cache key space stays bounded
+        table.add_row("Speed", self.format_speed(round(data.get("speed", 0.0), 1)))
         table.add_row("Distance", self.format_distance(data.get("distance", 0)))
         table.add_row("Time", self.format_time(data.get("time", 0)))
         table.add_row("Steps", f"{data.get('steps', 0):,}")
@@ -247,7 +254,27 @@ class DisplayManager:
 
         return table
 
+    def _create_live_table(self) -> Table:
+        """Create the live display table.
+
+        Returns:
+            Rich Table with current sensor data
+        """
+        return self._build_table(self._live_data)
+
+    def format_status_table(self, data: dict) -> Table:
+        """Create Rich Table for sensor display.
+
+        Args:
+            data: Dictionary with status, speed, distance, time, steps, calories
+
+        Returns:
+            Rich Table object
+        """
+        return self._build_table(data)
+
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def format_time(seconds: int) -> str:
         """Convert seconds to MM:SS format.
 
@@ -257,13 +284,11 @@ class DisplayManager:
         Returns:
             Formatted time string
         """
-        if not isinstance(seconds, int):
-            seconds = int(seconds)  # type: ignore[unreachable]
-        mins = seconds // 60
-        secs = seconds % 60
+        mins, secs = divmod(int(seconds), 60)
         return f"{mins}:{secs:02d}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def format_speed(km_h: float) -> str:
         """Format speed value.
 
@@ -276,6 +301,7 @@ class DisplayManager:
         return f"{km_h:.1f} km/h"
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def format_distance(meters: int) -> str:
         """Format distance value intelligently.
 
@@ -291,6 +317,7 @@ class DisplayManager:
         return f"{meters} m"
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def format_energy(kcal: int) -> str:
         """Format energy value.
 
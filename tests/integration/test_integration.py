@@ -70,7 +70,7 @@ async def test_live_display():
         pass
 
     # Show debug info
-    print(f"Queue size: {controller._update_queue.qsize()}")
+    print(f"Update pending: {controller._latest_event.is_set()}")
     print(f"Live data: {display._live_data}")
 
     # Stop live display
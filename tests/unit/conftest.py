@@ -0,0 +1,18 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from fitctrl.controller import TreadmillController
+from fitctrl.display import DisplayManager
+
+
+@pytest.fixture(scope="session")
+def display() -> DisplayManager:
+    """Session-wide DisplayManager so console setup runs once."""
+    return DisplayManager()
+
+
+@pytest.fixture(scope="session")
+def controller() -> TreadmillController:
+    """Session-wide TreadmillController; never connected to a device."""
+    return TreadmillController()
@@ -1,129 +1,118 @@
 #!/usr/bin/env python
 """Basic functionality test for REPL components without device."""
 
-import asyncio
 import pytest
 from fitctrl.display import DisplayManager
 from fitctrl.commands import COMMANDS, get_command, CommandCompleter
 from pyftms import ResultCode
 
 
-@pytest.mark.asyncio
-async def test_display():
-    """Test display functionality."""
-    print("\n=== Testing Display Manager ===")
-    display = DisplayManager()
-
-    # Test banner
-    print("\n1. Testing banner:")
+def _display_banner(display: DisplayManager) -> None:
     display.print_banner()
 
-    # Test status display
-    print("\n2. Testing status display:")
-    test_status = {
-        "status": "MANUAL_MODE",
-        "speed": 4.5,
-        "distance": 1240,
-        "time": 125,
-        "steps": 156,
-        "calories": 12,
-    }
-    display.print_status(test_status)
 
-    # Test command result
-    print("\n3. Testing command results:")
+def _display_status(display: DisplayManager) -> None:
+    display.print_status(
+        {
+            "status": "MANUAL_MODE",
+            "speed": 4.5,
+            "distance": 1240,
+            "time": 125,
+            "steps": 156,
+            "calories": 12,
+        }
+    )
+
+
+def _display_result(display: DisplayManager) -> None:
     display.print_result("start", ResultCode.SUCCESS)
     display.print_result("pause", ResultCode.INVALID_PARAMETER)
     display.print_result("stop", ResultCode.FAILED)
 
-    # Test messages
-    print("\n4. Testing messages:")
+
+def _display_messages(display: DisplayManager) -> None:
     display.print_info("This is an info message")
     display.print_error("This is an error message")
 
-    # Test formatting
-    print("\n5. Testing format functions:")
-    print(f"  Time 125s -> {display.format_time(125)}")
-    print(f"  Speed 4.5 km/h -> {display.format_speed(4.5)}")
-    print(f"  Distance 1240m -> {display.format_distance(1240)}")
-    print(f"  Distance 2500m -> {display.format_distance(2500)}")
-    print(f"  Energy 45 kcal -> {display.format_energy(45)}")
 
-    # Test help
-    print("\n6. Testing help display:")
-    display.print_help(COMMANDS)
-
-
-@pytest.mark.asyncio
-async def test_commands():
-    """Test command definitions."""
-    print("\n=== Testing Commands ===")
+def _display_format(display: DisplayManager) -> None:
+    assert display.format_time(125) == "2:05"
+    assert display.format_speed(4.5) == "4.5 km/h"
+    assert display.format_distance(1240) == "1.24 km"
+    assert display.format_distance(2500) == "2.50 km"
+    assert display.format_distance(500) == "500 m"
+    assert display.format_energy(45) == "45 kcal"
 
-    print(f"\n1. Total commands defined: {len(COMMANDS)}")
 
-    print("\n2. Command lookup:")
-    for cmd_str in ["connect", "c", "speed", "sp", "help", "h"]:
-        cmd = get_command(cmd_str)
-        if cmd:
-            print(f"  '{cmd_str}' -> {cmd.name} ({cmd.description})")
-
-    print("\n3. Command completer:")
-    completer = CommandCompleter()
-    print(f"  Completer initialized with {len(completer._command_names)} names")
-    print(
-        f"  Total completions available: {len(completer._command_names | completer._command_aliases)}"
-    )
-
-
-@pytest.mark.asyncio
-async def test_controller_properties():
-    """Test controller properties (without connection)."""
-    print("\n=== Testing Controller (Disconnected) ===")
-    from fitctrl.controller import TreadmillController
-
-    controller = TreadmillController()
+def _display_help(display: DisplayManager) -> None:
+    display.print_help(COMMANDS)
 
-    print("\n1. Initial state:")
-    print(f"  is_connected: {controller.is_connected}")
-    print(f"  device_info: {controller.device_info}")
-    print(f"  current_speed: {controller.current_speed}")
-    print(f"  training_status: {controller.training_status}")
 
-    print("\n2. Speed constraints:")
-    print(f"  MIN: {controller.SPEED_MIN} km/h")
-    print(f"  MAX: {controller.SPEED_MAX} km/h")
-    print(f"  STEP: {controller.SPEED_STEP} km/h")
+_DISPLAY_CASES = {
+    "banner": _display_banner,
+    "status": _display_status,
+    "result": _display_result,
+    "messages": _display_messages,
+    "format": _display_format,
+    "help": _display_help,
+}
 
-    print("\n3. Status when disconnected:")
-    status = controller.get_status()
-    print(f"  {status}")
 
+@pytest.mark.parametrize("case", sorted(_DISPLAY_CASES))
+def test_display(case, display):
+    """Test display functionality."""
+    _DISPLAY_CASES[case](display)
 
-async def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("WalkingPad R3 REPL - Basic Component Tests")
-    print("=" * 60)
 
-    try:
-        await test_display()
-        await test_commands()
-        await test_controller_properties()
+def test_commands():
+    """Test command definitions."""
+    assert len(COMMANDS) == 12
+
+    # Lookup by name and by alias resolves to the same command
+    for cmd_str, expected in [
+        ("connect", "connect"),
+        ("c", "connect"),
+        ("speed", "speed"),
+        ("sp", "speed"),
+        ("help", "help"),
+        ("h", "help"),
+    ]:
+        cmd = get_command(cmd_str)
+        assert cmd is not None
+        assert cmd.name == expected
 
-        print("\n" + "=" * 60)
-        print("✓ All basic tests completed successfully!")
-        print("=" * 60)
+    assert get_command("bogus") is None
 
-    except Exception as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
+    completer = CommandCompleter()
+    assert len(completer._command_names) == len(COMMANDS)
+    assert (
+        completer._all_completions
+        == completer._command_names | completer._command_aliases
+    )
 
-        traceback.print_exc()
-        return False
 
-    return True
+def test_controller_properties(controller):
+    """Test controller properties (without connection)."""
+    assert controller.is_connected is False
+    assert controller.device_info is None
+    assert controller.current_speed == 0.0
+    assert controller.training_status is None
+
+    assert controller.SPEED_MIN == 1.0
+    assert controller.SPEED_MAX == 12.0
+    assert controller.SPEED_STEP == 0.1
+
+    assert controller.get_status() == {
+        "status": "DISCONNECTED",
+        "speed": 0.0,
+        "distance": 0,
+        "time": 0,
+        "steps": 0,
+        "calories": 0,
+    }
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
-    exit(0 if success else 1)
+    # Standalone invocation reuses pytest's collection rather than
+    # duplicating every test call in a hand-rolled runner
+    exit(pytest.main([__file__]))